@@ -16,20 +16,52 @@ block the rest of the queue.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Sequence, Set
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+import os
 import re
-
-_MISSING_BACKTICKS_RE = re.compile(r"Type name '([^']+)' found without backticks")
-_OSCILLATION_RE = re.compile(r"Oscillation detected.*")
+import sys
+
+# Each rule is searched for independently over the whole log, which lets ``re``
+# skip ahead with its literal-prefix search instead of looping over lines in
+# Python.  None of the rules may match across a line break.
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"  # as in ``str.splitlines``
+_LINE_BREAK_RE = re.compile(f"[{_LINE_BREAKS}]")
+_LAST_LINE_BREAK_RE = re.compile(f"[{_LINE_BREAKS}][^{_LINE_BREAKS}]*\\Z")
+_MISSING_BACKTICKS_RE = re.compile(f"Type name '([^'{_LINE_BREAKS}]+)' found without backticks")
+_OSCILLATION_RE = re.compile(r"Oscillation detected")
 _UNACCEPTABLE_CHAR_RE = re.compile(r"unacceptable character #x([0-9A-Fa-f]{4})")
-_RECURSION_LIMIT_RE = re.compile(r"Recursion limit of (\d+) reached")
-_STATUS_DRAFT_RE = re.compile(r"status set to 'draft'", re.IGNORECASE)
-_FUTURE_DATE_RE = re.compile(r"future(?:-looking)? dates?", re.IGNORECASE)
-
-
-@dataclass
+_RECURSION_LIMIT_RE = re.compile(r"Recursion limit of \d+ reached")
+_NONE_TYPE_RE = re.compile(r"argument of type 'NoneType' is not iterable")
+_NOTES_PROCESSED_RE = re.compile(r"Notes Processed")
+_NOTES_ERRORS_RE = re.compile(r"Errors")
+# Case-insensitive rules: ``re.IGNORECASE`` disables the literal-prefix search,
+# so these run case-sensitively over a case-folded copy (see ``_fold_case``).
+_STATUS_DRAFT_RE = re.compile(r"status set to 'draft'")
+_FUTURE_DATE_RE = re.compile(r"future(?:-looking)? dates?")
+
+# For the letters used by the case-insensitive rules, ``str.lower`` agrees with
+# ``re.IGNORECASE`` except that ``re`` also folds these characters onto ASCII.
+_FOLD_EXTRA = {"İ": "i", "ı": "i", "ſ": "s"}
+_FOLD_EXTRA_TABLE = str.maketrans(_FOLD_EXTRA)
+
+# The last integer token on a line, delimited by whitespace or table borders,
+# e.g. ``│   339 │``.  The greedy prefix makes the search start from the end.
+_LAST_INT_TOKEN_RE = re.compile(r".*(?<![^\s│])([+-]?\d+)(?![^\s│])", re.DOTALL)
+
+# Files above the threshold are streamed in chunks instead of read in one go.
+_STREAM_THRESHOLD = 16 << 20
+_CHUNK_SIZE = 1 << 20
+
+# Upper bound on distinct type names / control codes kept per summary; further
+# values are dropped and ``IssueSummary.truncated`` is set.
+MAX_DISTINCT = 10_000
+
+
+@dataclass(slots=True)
 class IssueSummary:
     """Structured summary of the common failure patterns in the log."""
 
@@ -42,12 +74,26 @@ class IssueSummary:
     future_dated_metadata_notes: int = 0
     notes_processed: int | None = None
     notes_with_errors: int | None = None
+    truncated: bool = False
+
+    def joined_missing_backticks(self) -> str:
+        """Return the missing-backtick type names as a sorted, comma-separated list."""
+        return ", ".join(sorted(self.missing_backticks))
+
+    def joined_control_codes(self) -> str:
+        """Return the control character codes as a sorted, comma-separated list."""
+        return ", ".join(sorted(self.unacceptable_control_codes))
 
     def recommendations(self) -> List[str]:
         """Provide concrete follow-up steps derived from the captured issues."""
+        return self._recommendations(
+            self.joined_missing_backticks(), self.joined_control_codes()
+        )
+
+    def _recommendations(self, types: str, hex_codes: str) -> List[str]:
+        """Build the advice from precomputed ``joined_*`` listings."""
         advice: List[str] = []
         if self.missing_backticks:
-            types = ", ".join(sorted(self.missing_backticks))
             advice.append(
                 "Wrap Kotlin type identifiers in backticks during automated fixes to "
                 f"avoid validator oscillation (missing: {types})."
@@ -70,7 +116,6 @@ class IssueSummary:
                 "publishability decision without combing through raw logs."
             )
         if self.unacceptable_control_codes:
-            hex_codes = ", ".join(sorted(self.unacceptable_control_codes))
             advice.append(
                 "Strip non-printable control characters (e.g. 0x{}).".format(hex_codes)
             )
@@ -100,105 +145,226 @@ class IssueSummary:
         return advice
 
 
+def _extract_last_int_from(line: str) -> int | None:
+    """Return the last integer token contained in ``line``."""
+
+    if match := _LAST_INT_TOKEN_RE.match(line):
+        return int(match.group(1))
+    return None
+
+
 def analyse_lines(lines: Sequence[str]) -> IssueSummary:
     """Analyse the provided log lines and return a structured summary."""
 
-    summary = IssueSummary()
+    return analyse_log_text("\n".join(lines))
 
-    def _extract_last_int_from(line: str) -> int | None:
-        """Return the last integer-like token contained in ``line``."""
 
-        for token in reversed(line.split()):
-            token = token.strip("│")
-            if not token:
-                continue
-            try:
-                return int(token)
-            except ValueError:
-                continue
-        return None
-
-    for line in lines:
-        if match := _MISSING_BACKTICKS_RE.search(line):
-            summary.missing_backticks.add(match.group(1))
-        if match := _OSCILLATION_RE.search(line):
-            summary.oscillation_messages.append(match.group(0))
-        if match := _UNACCEPTABLE_CHAR_RE.search(line):
-            summary.unacceptable_control_codes.add(match.group(1).lower())
-        if match := _RECURSION_LIMIT_RE.search(line):
-            summary.recursion_limit_hits += 1
-        if "argument of type 'NoneType' is not iterable" in line:
-            summary.qa_verification_none_errors += 1
-        if _STATUS_DRAFT_RE.search(line):
-            summary.draft_status_notes += 1
-        if _FUTURE_DATE_RE.search(line):
-            summary.future_dated_metadata_notes += 1
-        if "Notes Processed" in line:
-            if (value := _extract_last_int_from(line)) is not None:
-                summary.notes_processed = value
-        if "Errors" in line and "Metric" not in line:
-            if (value := _extract_last_int_from(line)) is not None:
-                summary.notes_with_errors = value
+def _decode(data: bytes) -> str:
+    """Decode a line-aligned slice of a log file."""
+
+    return data.decode("utf-8", "replace")
+
+
+def _add_distinct(summary: IssueSummary, values: Set[str], value: str) -> None:
+    """Add an interned ``value`` unless ``values`` already holds ``MAX_DISTINCT``."""
+
+    if value in values:
+        return
+    if len(values) >= MAX_DISTINCT:
+        summary.truncated = True
+        return
+    values.add(sys.intern(value))
+
+
+def _fold_case(text: str) -> str:
+    """Return ``text`` folded the way ``re.IGNORECASE`` folds the rule letters."""
+
+    if any(char in text for char in _FOLD_EXTRA):
+        text = text.translate(_FOLD_EXTRA_TABLE)
+    return text.lower()
+
+
+def _first_match_per_line(
+    text: str, pattern: re.Pattern[str]
+) -> Iterator[Tuple[re.Match[str], int]]:
+    """Yield the first match of ``pattern`` on each line with that line's end."""
+
+    pos = 0
+    while match := pattern.search(text, pos):
+        end = brk.start() if (brk := _LINE_BREAK_RE.search(text, match.end())) else len(text)
+        yield match, end
+        pos = end + 1
+
+
+def _count_lines(text: str, pattern: re.Pattern[str]) -> int:
+    """Return how many lines of ``text`` contain a match of ``pattern``."""
+
+    return sum(1 for _ in _first_match_per_line(text, pattern))
 
+
+def _lines_matching(text: str, pattern: re.Pattern[str]) -> Iterator[str]:
+    """Yield every line of ``text`` that contains a match of ``pattern``."""
+
+    line_start = 0
+    for match, end in _first_match_per_line(text, pattern):
+        # Narrow the backwards search with the common "\n" before looking for
+        # the last break of any kind.
+        line_start = max(line_start, text.rfind("\n", line_start, match.start()) + 1)
+        if brk := _LAST_LINE_BREAK_RE.search(text, line_start, match.start()):
+            line_start = brk.end()
+        yield text[line_start:end]
+        line_start = end + 1
+
+
+def _scan(text: str, summary: IssueSummary) -> IssueSummary:
+    """Run every rule over ``text`` and add the matches to ``summary``.
+
+    ``text`` must start at the beginning of a line.  Each rule fires at most
+    once per line, mirroring a per-line ``search``.
+    """
+
+    for match, _ in _first_match_per_line(text, _MISSING_BACKTICKS_RE):
+        _add_distinct(summary, summary.missing_backticks, match.group(1))
+    for match, end in _first_match_per_line(text, _OSCILLATION_RE):
+        summary.oscillation_messages.append(text[match.start() : end])
+    for match, _ in _first_match_per_line(text, _UNACCEPTABLE_CHAR_RE):
+        _add_distinct(summary, summary.unacceptable_control_codes, match.group(1).lower())
+    summary.recursion_limit_hits += _count_lines(text, _RECURSION_LIMIT_RE)
+    summary.qa_verification_none_errors += _count_lines(text, _NONE_TYPE_RE)
+    folded = _fold_case(text)
+    summary.draft_status_notes += _count_lines(folded, _STATUS_DRAFT_RE)
+    summary.future_dated_metadata_notes += _count_lines(folded, _FUTURE_DATE_RE)
+    for line in _lines_matching(text, _NOTES_PROCESSED_RE):
+        if (value := _extract_last_int_from(line)) is not None:
+            summary.notes_processed = value
+    for line in _lines_matching(text, _NOTES_ERRORS_RE):
+        if "Metric" not in line and (value := _extract_last_int_from(line)) is not None:
+            summary.notes_with_errors = value
     return summary
 
 
 def analyse_log_text(text: str) -> IssueSummary:
-    """Convenience wrapper around :func:`analyse_lines`."""
+    """Analyse raw log text and return a structured summary."""
+
+    return _scan(text, IssueSummary())
 
-    return analyse_lines(text.splitlines())
+
+@lru_cache(maxsize=64)
+def _analyse_log_file_cached(path: str, mtime_ns: int, size: int) -> IssueSummary:
+    """Scan the log at ``path``; ``mtime_ns`` and ``size`` only key the cache.
+
+    Large files are streamed in chunks cut at line boundaries so peak memory
+    stays bounded by the chunk size plus the longest line rather than the file
+    size.  Each chunk is decoded before scanning so file and text analysis
+    share Unicode semantics, e.g. case-insensitive rules matching "ſtatus".
+    """
+
+    summary = IssueSummary()
+    with open(path, "rb") as handle:
+        if size <= _STREAM_THRESHOLD:
+            return _scan(_decode(handle.read()), summary)
+        # Pieces of the current, still unterminated line; only the new chunk is
+        # searched for a newline and the pieces are joined once per scan.
+        pending: List[bytes] = []
+        while chunk := handle.read(_CHUNK_SIZE):
+            cut = chunk.rfind(b"\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            _scan(_decode(b"".join(pending)), summary)
+            pending = [chunk[cut:]]
+        if tail := b"".join(pending):
+            _scan(_decode(tail), summary)
+    return summary
 
 
 def analyse_log_file(path: Path) -> IssueSummary:
-    """Load a log file and return the extracted summary."""
+    """Scan a log file and return the extracted summary.
+
+    Results are cached per resolved path, modification time and size, so an
+    unchanged log is only scanned once.  Callers get their own copy.
+    """
+
+    stat = path.stat()
+    cached = _analyse_log_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return replace(
+        cached,
+        oscillation_messages=list(cached.oscillation_messages),
+        missing_backticks=set(cached.missing_backticks),
+        unacceptable_control_codes=set(cached.unacceptable_control_codes),
+    )
+
 
-    content = path.read_text(encoding="utf-8")
-    return analyse_log_text(content)
+def analyse_log_files(
+    paths: Sequence[Path], workers: int | None = None
+) -> Dict[Path, IssueSummary]:
+    """Analyse several log files in parallel worker processes.
+
+    The compiled patterns live at module level, so forked workers inherit them
+    instead of recompiling per task.  ``workers`` defaults to the CPU count.
+    Repeated paths are analysed once and share a single entry in the result.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers}")
+    paths = list(dict.fromkeys(paths))
+    if workers == 1 or len(paths) <= 1:
+        return {path: analyse_log_file(path) for path in paths}
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        summaries = pool.map(analyse_log_file, paths, chunksize=chunksize)
+        return dict(zip(paths, summaries))
+
+
+_REPORT_HEADER = ("LLM review log analysis", "========================")
+_TMPL_PROCESSED = "Processed notes: {} (errors: {})"
+_TMPL_OSCILLATION_ITEM = "  - {}"
+_TMPL_MISSING_BACKTICKS = "Missing backticks around Kotlin types: {}"
+_TMPL_CONTROL_CODES = "Control character crashes encountered: {}"
+_TMPL_TRUNCATED = "Listings truncated to {} distinct entries each."
+_TMPL_RECURSION = "Recursion limit hit: {} time(s)"
+_TMPL_NONE_TYPE = "QA verification NoneType errors: {} occurrence(s)"
+_TMPL_FUTURE_DATED = "Future-dated metadata warnings: {} occurrence(s)"
+_TMPL_DRAFT_STATUS = "Draft-status metadata warnings: {} occurrence(s)"
+_TMPL_ADVICE_ITEM = "  * {}"
 
 
 def render_report(summary: IssueSummary) -> str:
     """Render a deterministic human-readable report for the provided summary."""
 
-    lines: List[str] = []
-    lines.append("LLM review log analysis")
-    lines.append("========================")
+    # Sort each set once and share the listing with the recommendations.
+    missing = summary.joined_missing_backticks()
+    codes = summary.joined_control_codes()
+
+    parts: List[str] = list(_REPORT_HEADER)
     if summary.notes_processed is not None:
-        processed = summary.notes_processed
-        errors = summary.notes_with_errors or 0
-        lines.append(f"Processed notes: {processed} (errors: {errors})")
+        parts.append(
+            _TMPL_PROCESSED.format(summary.notes_processed, summary.notes_with_errors or 0)
+        )
     if summary.oscillation_messages:
-        lines.append("")
-        lines.append("Oscillation detected in validators:")
-        for msg in summary.oscillation_messages:
-            lines.append(f"  - {msg}")
+        parts.extend(("", "Oscillation detected in validators:"))
+        parts.extend(map(_TMPL_OSCILLATION_ITEM.format, summary.oscillation_messages))
     if summary.missing_backticks:
-        lines.append("")
-        missing = ", ".join(sorted(summary.missing_backticks))
-        lines.append(f"Missing backticks around Kotlin types: {missing}")
+        parts.extend(("", _TMPL_MISSING_BACKTICKS.format(missing)))
     if summary.unacceptable_control_codes:
-        codes = ", ".join(sorted(summary.unacceptable_control_codes))
-        lines.append(f"Control character crashes encountered: {codes}")
+        parts.append(_TMPL_CONTROL_CODES.format(codes))
+    if summary.truncated:
+        parts.append(_TMPL_TRUNCATED.format(MAX_DISTINCT))
     if summary.recursion_limit_hits:
-        lines.append(f"Recursion limit hit: {summary.recursion_limit_hits} time(s)")
+        parts.append(_TMPL_RECURSION.format(summary.recursion_limit_hits))
     if summary.qa_verification_none_errors:
-        lines.append(
-            "QA verification NoneType errors: "
-            f"{summary.qa_verification_none_errors} occurrence(s)"
-        )
+        parts.append(_TMPL_NONE_TYPE.format(summary.qa_verification_none_errors))
     if summary.future_dated_metadata_notes:
-        lines.append(
-            f"Future-dated metadata warnings: {summary.future_dated_metadata_notes} occurrence(s)"
-        )
+        parts.append(_TMPL_FUTURE_DATED.format(summary.future_dated_metadata_notes))
     if summary.draft_status_notes:
-        lines.append(
-            f"Draft-status metadata warnings: {summary.draft_status_notes} occurrence(s)"
-        )
-    if advice := summary.recommendations():
-        lines.append("")
-        lines.append("Recommended follow-up actions:")
-        for item in advice:
-            lines.append(f"  * {item}")
-    return "\n".join(lines)
+        parts.append(_TMPL_DRAFT_STATUS.format(summary.draft_status_notes))
+    if advice := summary._recommendations(missing, codes):
+        parts.extend(("", "Recommended follow-up actions:"))
+        parts.extend(map(_TMPL_ADVICE_ITEM.format, advice))
+    return "\n".join(parts)
 
 
 __all__ = [
@@ -206,10 +372,23 @@ __all__ = [
     "analyse_lines",
     "analyse_log_text",
     "analyse_log_file",
+    "analyse_log_files",
     "render_report",
 ]
 
 
+def _positive_int(value: str) -> int:
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
 def _build_arg_parser():
     import argparse
 
@@ -217,9 +396,16 @@ def _build_arg_parser():
         description="Analyse llm-review logs and print a stability report.",
     )
     parser.add_argument(
-        "log_file",
+        "log_files",
         type=Path,
-        help="Path to the llm-review log file to analyse.",
+        nargs="+",
+        help="Path(s) to the llm-review log file(s) to analyse.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Worker processes used when analysing several logs (default: CPU count).",
     )
     return parser
 
@@ -227,8 +413,12 @@ def _build_arg_parser():
 def main(argv: Sequence[str] | None = None) -> int:
     parser = _build_arg_parser()
     args = parser.parse_args(argv)
-    summary = analyse_log_file(args.log_file)
-    print(render_report(summary))
+    summaries = analyse_log_files(args.log_files, workers=args.workers)
+    if len(args.log_files) == 1:
+        print(render_report(summaries[args.log_files[0]]))
+        return 0
+    reports = [f"{path}\n{render_report(summaries[path])}" for path in args.log_files]
+    print("\n\n".join(reports))
     return 0
 
 
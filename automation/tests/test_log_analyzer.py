@@ -1,10 +1,17 @@
+import re
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from automation.src.obsidian_vault import log_analyzer
 from automation.src.obsidian_vault.log_analyzer import (
     IssueSummary,
+    analyse_lines,
     analyse_log_file,
+    analyse_log_files,
     analyse_log_text,
+    main,
     render_report,
 )
 
@@ -52,6 +59,156 @@ class LogAnalyzerTests(unittest.TestCase):
         recommendations = summary.recommendations()
         self.assertNotIn("Investigate systemic issues", " ".join(recommendations))
 
+    def test_rules_sharing_a_line_are_all_detected(self):
+        summary = analyse_log_text(
+            "ERROR | Oscillation detected: Type name 'Job' found without backticks"
+        )
+        self.assertEqual(summary.missing_backticks, {"Job"})
+        self.assertEqual(len(summary.oscillation_messages), 1)
+        self.assertTrue(summary.oscillation_messages[0].startswith("Oscillation detected"))
+
+    def test_rules_are_counted_once_per_line(self):
+        hit = "Recursion limit of 25 reached"
+        summary = analyse_lines([hit, f"{hit}; {hit}", "no match here"])
+        self.assertEqual(summary.recursion_limit_hits, 2)
+
+    def test_totals_use_last_integer_on_the_row(self):
+        summary = analyse_lines(["│ Notes Processed │   12 │", "Errors in batch 3: 7 notes"])
+        self.assertEqual(summary.notes_processed, 12)
+        self.assertEqual(summary.notes_with_errors, 7)
+
+    def test_totals_ignore_digits_inside_other_tokens(self):
+        summary = analyse_lines(
+            [
+                "│ Errors          │   194 │",
+                "WARNING | Errors remain in InterviewQuestions/70-Kotlin/q-flows.md, see report",
+                "│ Notes Processed │    -3 │",
+            ]
+        )
+        self.assertEqual(summary.notes_with_errors, 194)
+        self.assertEqual(summary.notes_processed, -3)
+
+    def test_empty_log_file_yields_empty_summary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "empty.log"
+            log_path.touch()
+            self.assertEqual(analyse_log_file(log_path), IssueSummary())
+
+    def test_issue_summary_has_no_instance_dict(self):
+        self.assertFalse(hasattr(IssueSummary(), "__dict__"))
+
+    def test_analyse_log_files_matches_single_file_analysis(self):
+        other = Path(__file__)
+        summaries = analyse_log_files([self.log_path, other], workers=2)
+        self.assertEqual(list(summaries), [self.log_path, other])
+        self.assertEqual(summaries[self.log_path], self.summary)
+        self.assertEqual(summaries[other], analyse_log_file(other))
+
+    def test_keywords_without_the_full_rule_are_ignored(self):
+        summary = analyse_log_text(
+            "future-dated timestamps; Type name 'Errors 3' found without backticks"
+        )
+        self.assertEqual(summary.future_dated_metadata_notes, 0)
+        self.assertEqual(summary.missing_backticks, {"Errors 3"})
+        self.assertIsNone(summary.notes_with_errors)
+
+    def test_streamed_large_file_matches_in_memory_scan(self):
+        log_analyzer._analyse_log_file_cached.cache_clear()
+        with mock.patch.multiple(log_analyzer, _STREAM_THRESHOLD=0, _CHUNK_SIZE=97):
+            streamed = analyse_log_file(self.log_path)
+        self.assertEqual(streamed, self.summary)
+
+    def test_streamed_line_longer_than_chunks_is_scanned_whole(self):
+        log_analyzer._analyse_log_file_cached.cache_clear()
+        line = "x" * 500 + " Recursion limit of 25 reached " + "y" * 500
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "long.log"
+            log_path.write_text(f"{line}\n{line}", encoding="utf-8")
+            with mock.patch.multiple(log_analyzer, _STREAM_THRESHOLD=0, _CHUNK_SIZE=64):
+                summary = analyse_log_file(log_path)
+        self.assertEqual(summary.recursion_limit_hits, 2)
+
+    def test_cached_file_results_are_isolated_copies(self):
+        first = analyse_log_file(self.log_path)
+        first.missing_backticks.add("Channel")
+        self.assertNotIn("Channel", analyse_log_file(self.log_path).missing_backticks)
+
+    def test_modified_file_is_rescanned(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "review.log"
+            log_path.write_text("Recursion limit of 25 reached\n", encoding="utf-8")
+            self.assertEqual(analyse_log_file(log_path).recursion_limit_hits, 1)
+            log_path.write_text("Recursion limit of 25 reached\n" * 2, encoding="utf-8")
+            self.assertEqual(analyse_log_file(log_path).recursion_limit_hits, 2)
+
+    def test_distinct_values_are_capped(self):
+        text = "\n".join(
+            f"Type name '{name}' found without backticks" for name in ("A", "B", "A", "C")
+        )
+        with mock.patch.object(log_analyzer, "MAX_DISTINCT", 2):
+            summary = analyse_log_text(text)
+            report = render_report(summary)
+        self.assertEqual(summary.missing_backticks, {"A", "B"})
+        self.assertTrue(summary.truncated)
+        self.assertIn("truncated to 2 distinct entries", report)
+        self.assertFalse(self.summary.truncated)
+
+    def test_non_positive_worker_counts_are_rejected(self):
+        with self.assertRaises(ValueError):
+            analyse_log_files([self.log_path], workers=0)
+        for value in ("0", "-2", "many"):
+            with self.subTest(value=value), mock.patch("sys.stderr"):
+                with self.assertRaises(SystemExit) as ctx:
+                    main(["--workers", value, str(self.log_path)])
+                self.assertEqual(ctx.exception.code, 2)
+
+    def test_unicode_case_variants_of_keywords_are_counted(self):
+        text = "ſtatus set to 'draft'; FUTURE DATES\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "review.log"
+            log_path.write_text(text, encoding="utf-8")
+            from_file = analyse_log_file(log_path)
+        for summary in (analyse_log_text(text), from_file):
+            self.assertEqual(summary.draft_status_notes, 1)
+            self.assertEqual(summary.future_dated_metadata_notes, 1)
+
+    def test_keyword_overlapping_previous_rule_match_is_counted(self):
+        summary = analyse_log_text("Future-looking dateSTATUS SET TO 'DRAFT'")
+        self.assertEqual(summary.future_dated_metadata_notes, 1)
+        self.assertEqual(summary.draft_status_notes, 1)
+
+    def test_case_folding_agrees_with_re_ignorecase_for_rule_letters(self):
+        letters = set("status set to 'draft' future-looking dates") - set(" '-")
+        any_letter = re.compile(f"(?i:[{''.join(sorted(letters))}])")
+        mismatches = []
+        for code in range(0x110000):
+            char = chr(code)
+            folded = log_analyzer._fold_case(char)
+            if any_letter.fullmatch(char):
+                agrees = folded in letters and re.fullmatch(f"(?i:{folded})", char)
+            else:
+                agrees = not letters.intersection(folded)
+            if not agrees:
+                mismatches.append(hex(code))
+        self.assertEqual(mismatches, [])
+
+    def test_lines_split_like_str_splitlines(self):
+        summary = analyse_log_text("Oscillation detected x\u2028Recursion limit of 3 reached")
+        self.assertEqual(summary.oscillation_messages, ["Oscillation detected x"])
+        self.assertEqual(summary.recursion_limit_hits, 1)
+        summary = analyse_log_text("│ Errors │ 7 │\rErrors: 5\x0cMetric")
+        self.assertEqual(summary.notes_with_errors, 5)
+        summary = analyse_log_text("Type name 'A\x85B' found without backticks")
+        self.assertEqual(summary.missing_backticks, set())
+
+    def test_repeated_log_files_are_each_reported(self):
+        summaries = analyse_log_files([self.log_path, self.log_path], workers=2)
+        self.assertEqual(list(summaries), [self.log_path])
+        with mock.patch("builtins.print") as fake_print:
+            main([str(self.log_path), str(self.log_path)])
+        output = fake_print.call_args.args[0]
+        self.assertEqual(output.count(f"{self.log_path}\nLLM review log analysis"), 2)
+
 
 if __name__ == "__main__":
     unittest.main()